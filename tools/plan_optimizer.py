@@ -24,9 +24,18 @@ Usage示例::
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
 import os
+import re
+import tempfile
 import textwrap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from html import unescape
 from pathlib import Path
 from typing import Iterable, List, Optional
 
@@ -42,11 +51,68 @@ else:  # pragma: no cover - 运行时提示用户安装依赖
 openai_spec = importlib.util.find_spec("openai")
 if openai_spec is not None:
     OpenAI = importlib.import_module("openai").OpenAI
+    AsyncOpenAI = importlib.import_module("openai").AsyncOpenAI
 else:  # pragma: no cover - 运行时提示用户安装依赖
     OpenAI = None
+    AsyncOpenAI = None
+
+lxml_spec = importlib.util.find_spec("lxml")
+if lxml_spec is not None:
+    lxml_html = importlib.import_module("lxml.html")
+else:  # pragma: no cover - 未安装时回落至正则解析
+    lxml_html = None
 
 
 DUCKDUCKGO_URL = "https://duckduckgo.com/html/"
+DUCKDUCKGO_USER_AGENT = "Mozilla/5.0 (ResearchPlanOptimizer)"
+# DuckDuckGo 对高频抓取会临时封禁, 相邻两次检索至少间隔该秒数。
+DUCKDUCKGO_MIN_INTERVAL = 3.0
+
+# 正则回退与 lxml 路径保持一致: 按 class 词匹配, 链接取自带 href 的 result__a。
+_CLASS_ATTR = r'\bclass="(?:[^"]*\s)?{name}(?:\s[^"]*)?"'
+_RESULT_BODY_RE = re.compile(r"<div\b[^>]*" + _CLASS_ATTR.format(name="result__body"))
+_RESULT_LINK_RE = re.compile(
+    r"<a\b(?=[^>]*" + _CLASS_ATTR.format(name="result__a") + r')(?=[^>]*\bhref="([^"]*)")'
+    r"[^>]*>(.*?)(?:</a>|$)",
+    re.DOTALL,
+)
+_SNIPPET_RE = re.compile(
+    r"<(\w+)\b[^>]*" + _CLASS_ATTR.format(name="result__snippet") + r"[^>]*>(.*?)(?:</\1>|$)",
+    re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^>]*>")
+_XPATH_CLASS = ".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+_HTTP_SESSION = None
+_DDG_LOCK = threading.Lock()
+_last_ddg_request: Optional[float] = None
+
+
+def get_http_session():
+    """返回进程内共享的 ``requests.Session``, 复用 TCP/TLS 连接.
+
+    遇到 429/503 时按 ``Retry-After`` 或指数退避自动重试, 而非直接中断运行。
+    """
+
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers["User-Agent"] = DUCKDUCKGO_USER_AGENT
+        retry = Retry(
+            total=3,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset({"GET", "POST"}),
+            backoff_factor=2,
+            respect_retry_after_header=True,
+        )
+        adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
 
 
 @dataclass
@@ -56,10 +122,12 @@ class SearchResult:
     snippet: str
 
 
-def fetch_duckduckgo_results(query: str, max_results: int = 5) -> List[SearchResult]:
+def fetch_duckduckgo_results(
+    query: str, max_results: int = 5, proxy: Optional[str] = None
+) -> List[SearchResult]:
     """Fetch简易 DuckDuckGo 搜索结果.
 
-    为避免依赖复杂解析库, 这里采用 DuckDuckGo 简洁 HTML 接口并做轻量解析。
+    采用 DuckDuckGo 简洁 HTML 接口; 安装 lxml 时由 libxml2 解析, 否则做轻量正则解析。
     """
 
     if requests is None:
@@ -67,42 +135,96 @@ def fetch_duckduckgo_results(query: str, max_results: int = 5) -> List[SearchRes
             "缺少 requests 依赖, 可执行 'pip install requests' 或使用 --offline 模式。"
         )
 
+    global _last_ddg_request
     params = {"q": query, "kl": "wt-wt"}
-    headers = {"User-Agent": "Mozilla/5.0 (ResearchPlanOptimizer)"}
-    response = requests.post(DUCKDUCKGO_URL, data=params, headers=headers, timeout=15)
+    proxies = {"http": proxy, "https": proxy} if proxy else None
+    with _DDG_LOCK:
+        if _last_ddg_request is not None:
+            wait = DUCKDUCKGO_MIN_INTERVAL - (time.monotonic() - _last_ddg_request)
+            if wait > 0:
+                time.sleep(wait)
+        try:
+            response = get_http_session().post(
+                DUCKDUCKGO_URL, data=params, proxies=proxies, timeout=15
+            )
+        finally:
+            _last_ddg_request = time.monotonic()
     response.raise_for_status()
 
+    return parse_duckduckgo_html(response.text, max_results)
+
+
+def parse_duckduckgo_html(html: str, max_results: int = 5) -> List[SearchResult]:
+    """解析 DuckDuckGo 简洁 HTML 页面, 优先使用 lxml."""
+
+    if lxml_html is not None:
+        return _parse_duckduckgo_lxml(html, max_results)
+    return _parse_duckduckgo_regex(html, max_results)
+
+
+def _parse_duckduckgo_lxml(html: str, max_results: int) -> List[SearchResult]:
+    """一次性构建 DOM 树, 按 CSS 类名提取标题、链接与摘要."""
+
+    if not html.strip():
+        return []
+
     results: List[SearchResult] = []
-    for block in response.text.split('<div class="result__body">'):
-        if "result__title" not in block:
-            continue
-        title_start = block.find('result__a">')
-        url_start = block.find('href="')
-        snippet_start = block.find('result__snippet">')
-        if title_start == -1 or url_start == -1:
+    tree = lxml_html.fromstring(html)
+    for body in tree.xpath(_XPATH_CLASS.format(tag="div", name="result__body")):
+        anchors = body.xpath(_XPATH_CLASS.format(tag="a", name="result__a") + "[@href]")
+        if not anchors:
             continue
+        snippets = body.xpath(_XPATH_CLASS.format(tag="*", name="result__snippet"))
+        results.append(
+            SearchResult(
+                title=anchors[0].text_content().strip(),
+                url=anchors[0].get("href"),
+                snippet=snippets[0].text_content().strip() if snippets else "",
+            )
+        )
+        if len(results) >= max_results:
+            break
+    return results
+
 
-        title = block[title_start + len('result__a">') :].split("</a>", 1)[0]
-        title = title.replace("<b>", "").replace("</b>", "").strip()
+def _parse_duckduckgo_regex(html: str, max_results: int) -> List[SearchResult]:
+    """无 lxml 时的回退解析.
 
-        url = block[url_start + len('href="') :].split('"', 1)[0]
+    按 ``result__body`` 标记逐块定位, 在块范围内用预编译正则检索标题、链接与摘要,
+    整页只扫描一遍, 不再为每个结果切分出子字符串。去除标签并解码 HTML 实体,
+    输出与 lxml 路径的 ``text_content()`` 一致。
+    """
+
+    results: List[SearchResult] = []
+    starts = [match.start() for match in _RESULT_BODY_RE.finditer(html)]
+    for index, start in enumerate(starts):
+        end = starts[index + 1] if index + 1 < len(starts) else len(html)
+        link_match = _RESULT_LINK_RE.search(html, start, end)
+        if link_match is None:
+            continue
 
         snippet = ""
-        if snippet_start != -1:
-            snippet = block[snippet_start + len('result__snippet">') :].split("</a>", 1)[0]
-            snippet = (
-                snippet.replace("<b>", "")
-                .replace("</b>", "")
-                .replace("<span class=\"result__snippet js-result-snippet\">", "")
-                .replace("</span>", "")
-                .strip()
+        snippet_match = _SNIPPET_RE.search(html, start, end)
+        if snippet_match is not None:
+            snippet = _html_text(snippet_match.group(2))
+        results.append(
+            SearchResult(
+                title=_html_text(link_match.group(2)),
+                url=unescape(link_match.group(1)),
+                snippet=snippet,
             )
-        results.append(SearchResult(title=title, url=url, snippet=snippet))
+        )
         if len(results) >= max_results:
             break
     return results
 
 
+def _html_text(fragment: str) -> str:
+    """去除 HTML 片段中的标签并解码实体 (``&amp;`` -> ``&``)."""
+
+    return unescape(_TAG_RE.sub("", fragment)).strip()
+
+
 @dataclass
 class GPTInteractionConfig:
     model: str
@@ -111,6 +233,55 @@ class GPTInteractionConfig:
     max_tokens: int = 1200
 
 
+class ResponseCache:
+    """基于本地文件的 GPT 响应缓存.
+
+    以 ``sha256(model|prompt|temperature|max_tokens)`` 为键, 每条响应保存为
+    ``<directory>/<key>.txt``; 设置 ``ttl`` (秒) 后过期条目视为未命中。
+    """
+
+    def __init__(self, directory: Path, ttl: Optional[float] = None) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(config: GPTInteractionConfig, prompt: str) -> str:
+        raw = "|".join(
+            (config.model, prompt, repr(config.temperature), str(config.max_tokens))
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.directory / f"{key}.txt"
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                self.misses += 1
+                return None
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        # 批量任务可能并发写入同一键, 先写唯一临时文件再原子替换。
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f"{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_name, self.directory / f"{key}.txt")
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
 def build_prompt(plan_text: str, results: Iterable[SearchResult], objective: str) -> str:
     """组装发送给GPT的提示词."""
 
@@ -137,16 +308,65 @@ def build_prompt(plan_text: str, results: Iterable[SearchResult], objective: str
     return textwrap.dedent(template)
 
 
-def call_gpt(config: GPTInteractionConfig, prompt: str) -> str:
-    """调用OpenAI GPT接口."""
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str):
+    """按 API Key 复用 OpenAI 客户端, 避免重复初始化 HTTP 连接池."""
 
     if OpenAI is None:
         raise ModuleNotFoundError(
             "缺少 openai 依赖, 可执行 'pip install openai>=1.0' 或使用 --offline 模式。"
         )
+    return OpenAI(api_key=api_key)
+
 
-    client = OpenAI(api_key=config.api_key)
-    response = client.responses.create(
+def call_gpt(
+    config: GPTInteractionConfig,
+    prompt: str,
+    cache: Optional[ResponseCache] = None,
+    stream: bool = False,
+) -> str:
+    """调用OpenAI GPT接口, 提供 ``cache`` 时先查询本地缓存.
+
+    ``stream=True`` 时使用流式接口, 边生成边打印到终端, 返回完整文本。
+    """
+
+    key = None
+    if cache is not None:
+        key = ResponseCache.make_key(config, prompt)
+        cached = cache.get(key)
+        if cached is not None:
+            if stream:
+                print(cached)
+            return cached
+
+    client = get_openai_client(config.api_key)
+    request = dict(
+        model=config.model,
+        input=[{"role": "user", "content": prompt}],
+        temperature=config.temperature,
+        max_output_tokens=config.max_tokens,
+    )
+    if stream:
+        with client.responses.stream(**request) as events:
+            for event in events:
+                if event.type == "response.output_text.delta":
+                    print(event.delta, end="", flush=True)
+            output_text = events.get_final_response().output_text
+        print()
+    else:
+        output_text = client.responses.create(**request).output_text
+    if cache is not None:
+        cache.set(key, output_text)
+    return output_text
+
+
+async def call_gpt_async(config: GPTInteractionConfig, prompt: str, client) -> str:
+    """异步调用OpenAI GPT接口, 供批量模式并发使用.
+
+    ``client`` 为调用方持有并负责关闭的 ``AsyncOpenAI`` 实例。
+    """
+
+    response = await client.responses.create(
         model=config.model,
         input=[{"role": "user", "content": prompt}],
         temperature=config.temperature,
@@ -155,6 +375,44 @@ def call_gpt(config: GPTInteractionConfig, prompt: str) -> str:
     return response.output_text
 
 
+async def gather_gpt(
+    config: GPTInteractionConfig,
+    prompts: List[str],
+    cache: Optional[ResponseCache] = None,
+    concurrency: int = 5,
+) -> list:
+    """并发发送多条提示词, 以信号量限制同时进行的请求数.
+
+    返回值与 ``prompts`` 顺序一致; 单个请求失败时对应位置为异常对象。
+    """
+
+    if concurrency < 1:
+        raise ValueError(f"并发数必须为正整数: {concurrency}")
+    if AsyncOpenAI is None:
+        raise ModuleNotFoundError(
+            "缺少 openai 依赖, 可执行 'pip install openai>=1.0' 或使用 --offline 模式。"
+        )
+    async with AsyncOpenAI(api_key=config.api_key) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def complete(prompt: str) -> str:
+            key = None
+            if cache is not None:
+                key = ResponseCache.make_key(config, prompt)
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+            async with semaphore:
+                output_text = await call_gpt_async(config, prompt, client)
+            if cache is not None:
+                cache.set(key, output_text)
+            return output_text
+
+        return await asyncio.gather(
+            *(complete(p) for p in prompts), return_exceptions=True
+        )
+
+
 def generate_offline_output(plan_text: str, objective: str) -> str:
     """在无法访问外部服务时, 基于简单启发式生成建议."""
 
@@ -178,6 +436,8 @@ def generate_offline_output(plan_text: str, objective: str) -> str:
 
 
 DEFAULT_WINDOWS_OUTPUT_DIR = Path("D:/work/2025hxczqn")
+GPT_CACHE_DIRNAME = ".gpt_cache"
+DEFAULT_BATCH_CONCURRENCY = 5
 
 
 def resolve_output_directory(output_dir: Optional[str]) -> Path:
@@ -199,10 +459,15 @@ def resolve_output_directory(output_dir: Optional[str]) -> Path:
     return target
 
 
-def determine_output_path(plan_path: str, output_dir: Optional[str]) -> str:
+def determine_output_path(plan_path: str, output_dir: Optional[str], suffix: str = "") -> str:
     base_name = os.path.splitext(os.path.basename(plan_path))[0]
     target_dir = resolve_output_directory(output_dir)
-    return str(target_dir / f"{base_name}_optimized.md")
+    return str(target_dir / f"{base_name}_optimized{suffix}.md")
+
+
+def read_plan_text(plan_path: str) -> str:
+    with open(plan_path, "r", encoding="utf-8") as f:
+        return f.read()
 
 
 def run(
@@ -213,57 +478,216 @@ def run(
     api_key: Optional[str],
     offline: bool = False,
     output_dir: Optional[str] = None,
+    temperature: float = 0.3,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    cache_always: bool = False,
+    proxy: Optional[str] = None,
 ) -> None:
     if not os.path.exists(plan_path):
         raise FileNotFoundError(f"计划文件不存在: {plan_path}")
 
-    with open(plan_path, "r", encoding="utf-8") as f:
-        plan_text = f.read()
-
     search_results: List[SearchResult] = []
 
     if offline:
         print("[INFO] Offline 模式开启, 跳过网络检索与GPT调用。")
+        plan_text = read_plan_text(plan_path)
         gpt_output = generate_offline_output(plan_text, objective)
     else:
         print("[INFO] Fetching web references...")
-        search_results = fetch_duckduckgo_results(query)
+        # 计划读取与网络检索互不依赖, 并行执行以重叠 I/O 等待。
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            plan_future = executor.submit(read_plan_text, plan_path)
+            search_future = executor.submit(fetch_duckduckgo_results, query, proxy=proxy)
+            plan_text = plan_future.result()
+            search_results = search_future.result()
 
         print("[INFO] Building prompt and contacting GPT...")
         config = GPTInteractionConfig(
             model=model,
             api_key=api_key or os.environ.get("OPENAI_API_KEY", ""),
+            temperature=temperature,
         )
         if not config.api_key:
             raise EnvironmentError("未提供 OpenAI API Key, 请通过环境变量或参数设置。")
 
+        # 仅在输出确定 (temperature<=0) 或用户显式要求时复用缓存结果。
+        cache = None
+        if use_cache and (config.temperature <= 0 or cache_always):
+            cache = ResponseCache(
+                resolve_output_directory(output_dir) / GPT_CACHE_DIRNAME, ttl=cache_ttl
+            )
+
         prompt = build_prompt(plan_text=plan_text, results=search_results, objective=objective)
-        gpt_output = call_gpt(config, prompt)
+        print("\n===== GPT 建议 =====\n")
+        gpt_output = call_gpt(config, prompt, cache=cache, stream=True)
+        if cache is not None:
+            print(f"[INFO] GPT 响应缓存: 命中 {cache.hits} 次, 未命中 {cache.misses} 次。")
 
     output_path = determine_output_path(plan_path, output_dir)
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(gpt_output)
 
     print("[INFO] 优化建议已生成 ->", output_path)
-    print("\n===== GPT 建议 =====\n")
-    print(gpt_output)
+    if offline:
+        print("\n===== GPT 建议 =====\n")
+        print(gpt_output)
+
+
+def run_batch(
+    plan_paths: List[str],
+    query: str,
+    model: str,
+    objectives: List[str],
+    api_key: Optional[str],
+    offline: bool = False,
+    output_dir: Optional[str] = None,
+    temperature: float = 0.3,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    cache_always: bool = False,
+    proxy: Optional[str] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> int:
+    """批量模式: 对每份计划与每个优化目标的组合并发生成建议.
+
+    网络检索只执行一次并由全部任务共享; 多个目标时输出文件名追加 ``_<序号>``。
+    输出文件名取自计划文件名, 因此文件名 (不含扩展名) 重复时直接报错。
+    返回失败任务数。
+    """
+
+    missing = [path for path in plan_paths if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"计划文件不存在: {', '.join(missing)}")
+    base_names = [os.path.splitext(os.path.basename(path))[0] for path in plan_paths]
+    duplicates = sorted({name for name in base_names if base_names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"计划文件名重复, 输出将相互覆盖: {', '.join(duplicates)}")
+
+    plan_texts = {path: read_plan_text(path) for path in plan_paths}
+    jobs = [
+        (path, index, objective)
+        for path in plan_paths
+        for index, objective in enumerate(objectives)
+    ]
+
+    if offline:
+        print("[INFO] Offline 模式开启, 跳过网络检索与GPT调用。")
+        outputs = [
+            generate_offline_output(plan_texts[path], objective) for path, _, objective in jobs
+        ]
+    else:
+        print("[INFO] Fetching web references...")
+        search_results = fetch_duckduckgo_results(query, proxy=proxy)
+
+        config = GPTInteractionConfig(
+            model=model,
+            api_key=api_key or os.environ.get("OPENAI_API_KEY", ""),
+            temperature=temperature,
+        )
+        if not config.api_key:
+            raise EnvironmentError("未提供 OpenAI API Key, 请通过环境变量或参数设置。")
+
+        cache = None
+        if use_cache and (config.temperature <= 0 or cache_always):
+            cache = ResponseCache(
+                resolve_output_directory(output_dir) / GPT_CACHE_DIRNAME, ttl=cache_ttl
+            )
+
+        prompts = [
+            build_prompt(plan_text=plan_texts[path], results=search_results, objective=objective)
+            for path, _, objective in jobs
+        ]
+        print(f"[INFO] 并发调用 GPT: 共 {len(prompts)} 个任务, 并发上限 {concurrency}...")
+        outputs = asyncio.run(gather_gpt(config, prompts, cache=cache, concurrency=concurrency))
+        if cache is not None:
+            print(f"[INFO] GPT 响应缓存: 命中 {cache.hits} 次, 未命中 {cache.misses} 次。")
+
+    failed = 0
+    for (path, index, _), gpt_output in zip(jobs, outputs):
+        if isinstance(gpt_output, BaseException):
+            print(f"[ERROR] {path} (目标 {index + 1}) 优化失败: {gpt_output}")
+            failed += 1
+            continue
+        suffix = f"_{index + 1}" if len(objectives) > 1 else ""
+        output_path = determine_output_path(path, output_dir, suffix)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(gpt_output)
+        print("[INFO] 优化建议已生成 ->", output_path)
+    if failed:
+        print(f"[ERROR] 共 {failed}/{len(jobs)} 个任务失败。")
+    return failed
+
+
+def _positive_int(value: str) -> int:
+    """argparse 类型: 仅接受 >=1 的整数."""
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"需要整数, 收到 {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"需要 >=1 的整数, 收到 {number}")
+    return number
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="研究计划迭代优化工具")
-    parser.add_argument("--plan", required=True, help="研究计划 Markdown 文件路径")
+    plan_group = parser.add_mutually_exclusive_group(required=True)
+    plan_group.add_argument("--plan", help="研究计划 Markdown 文件路径")
+    plan_group.add_argument(
+        "--plans",
+        nargs="+",
+        help="批量模式: 多个研究计划文件, 并发调用 GPT",
+    )
     parser.add_argument("--query", required=True, help="DuckDuckGo 检索关键词")
     parser.add_argument(
         "--objective",
         default="提升创新性、强化方法论可行性并指出潜在合作方向。",
         help="向GPT说明的优化目标",
     )
+    parser.add_argument(
+        "--objectives",
+        nargs="+",
+        help="批量模式: 多个优化目标, 与每份计划逐一组合 (覆盖 --objective)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help=f"批量模式下同时进行的 GPT 请求数 (默认 {DEFAULT_BATCH_CONCURRENCY})",
+    )
     parser.add_argument(
         "--model",
         default="gpt-4o-mini",
         help="OpenAI 模型名称 (例如 gpt-4o-mini, gpt-4.1 等)",
     )
     parser.add_argument("--api-key", help="OpenAI API Key, 优先级高于环境变量")
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=0.3,
+        help="GPT 采样温度 (默认 0.3); 设为 0 时默认启用响应缓存",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="禁用输出目录下 .gpt_cache 中的 GPT 响应缓存",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        help="GPT 响应缓存有效期 (秒), 默认永不过期",
+    )
+    parser.add_argument(
+        "--cache-always",
+        action="store_true",
+        help="即使 temperature>0 也复用缓存的 GPT 响应",
+    )
+    parser.add_argument(
+        "--proxy",
+        help="DuckDuckGo 检索使用的代理地址, 例如 http://127.0.0.1:7890",
+    )
     parser.add_argument(
         "--offline",
         action="store_true",
@@ -278,12 +702,36 @@ def parse_args() -> argparse.Namespace:
 
 if __name__ == "__main__":
     args = parse_args()
-    run(
-        plan_path=args.plan,
-        query=args.query,
-        model=args.model,
-        objective=args.objective,
-        api_key=args.api_key,
-        offline=args.offline,
-        output_dir=args.output_dir,
-    )
+    if args.plans or args.objectives:
+        failed = run_batch(
+            plan_paths=args.plans or [args.plan],
+            query=args.query,
+            model=args.model,
+            objectives=args.objectives or [args.objective],
+            api_key=args.api_key,
+            offline=args.offline,
+            output_dir=args.output_dir,
+            temperature=args.temperature,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl,
+            cache_always=args.cache_always,
+            proxy=args.proxy,
+            concurrency=args.concurrency,
+        )
+        if failed:
+            raise SystemExit(1)
+    else:
+        run(
+            plan_path=args.plan,
+            query=args.query,
+            model=args.model,
+            objective=args.objective,
+            api_key=args.api_key,
+            offline=args.offline,
+            output_dir=args.output_dir,
+            temperature=args.temperature,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl,
+            cache_always=args.cache_always,
+            proxy=args.proxy,
+        )
@@ -9,28 +9,104 @@ facilitate direct inclusion in research plans.
 from __future__ import annotations
 
 import argparse
+import contextlib
+import csv
 import dataclasses
+import hashlib
+import heapq
+import io
 import json
+import os
 import sys
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
 
 try:
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - optional dependency for offline cache usage
     requests = None
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib json is used instead
+    orjson = None
+
+try:
+    import ijson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - large caches are loaded in one piece
+    ijson = None
+
 
 CROSSREF_API = "https://api.crossref.org/works"
+DOI_URL_PREFIX = "https://doi.org/"
+CROSSREF_MAX_ROWS = 1000
+# Crossref rejects offsets beyond this; deeper result sets need cursor paging.
+CROSSREF_MAX_OFFSET = 10000
+# Stay inside the polite pool: few concurrent pages, staggered submissions.
+CROSSREF_PAGE_WORKERS = 4
+CROSSREF_SUBMIT_INTERVAL = 0.25
+# Only the fields read by fetch_articles; skips abstracts, references, funders etc.
+CROSSREF_SELECT = "DOI,title,issued,container-title,is-referenced-by-count,author"
 USER_AGENT = (
     "sci-citation-crawler/1.0 (mailto:research-informatics@example.com)"
 )
 
+QUERY_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "sci_citation_crawler"
+)
+DEFAULT_QUERY_CACHE_TTL = 24 * 60 * 60
+HTTP_CACHE_DIR = QUERY_CACHE_DIR / "http"
+# Streaming parse only pays off on large files; small caches load faster in one go.
+STREAMING_CACHE_THRESHOLD = 5_000_000
+OUTPUT_BUFFER_SIZE = 1 << 16
+ARTICLE_MEMO_SIZE = 32
+
+# Markdown table cells cannot contain "|" or line breaks; swap the bar for a
+# full-width one and fold newlines into spaces.
+_MD_ESCAPE = str.maketrans({"|": "／", "\n": " ", "\r": ""})
+_BY_CITATIONS = attrgetter("citation_count")
+
+_SESSION = None
+# (query arguments) -> (fetch time, articles), newest last; see fetch_articles.
+_ARTICLE_MEMO: "OrderedDict[tuple, Tuple[float, Tuple[Article, ...]]]" = OrderedDict()
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(value) -> bytes:
+    """Encode a value as UTF-8 JSON bytes, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+# ``slots=True`` needs Python 3.10+; older interpreters fall back to dict-backed instances.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(frozen=True, **_SLOTS)
 class Article:
-    """Container for article metadata returned by Crossref."""
+    """Container for article metadata returned by Crossref.
+
+    Instances are immutable and, on Python 3.10+, slotted so large result sets
+    carry no per-instance ``__dict__``.
+    """
 
     title: str
     doi: str
@@ -40,13 +116,141 @@ class Article:
     authors: str
 
 
-def fetch_articles(
+def _get_session():
+    """Return the shared HTTP session, creating it on first use.
+
+    The session keeps TCP+TLS connections alive between requests and retries
+    transient Crossref failures with exponential backoff.
+    """
+
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def _query_cache_key(
     query: str,
-    rows: int = 20,
-    from_year: Optional[int] = None,
-    issn_filter: Optional[str] = None,
-) -> List[Article]:
-    """Retrieve highly cited articles from Crossref."""
+    rows: int,
+    from_year: Optional[int],
+    issn_filter: Optional[str],
+    full_text_only: bool = False,
+) -> str:
+    """Hash the Crossref request parameters into a cache file stem."""
+
+    payload = json.dumps(
+        {
+            "query": query,
+            "rows": rows,
+            "from_year": from_year,
+            "issn": issn_filter,
+            "full_text_only": full_text_only,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_query_cache(cache_file: Path, ttl: float) -> Optional[List[dict]]:
+    """Return cached Crossref items if the file exists and is younger than ``ttl``."""
+
+    try:
+        if time.time() - cache_file.stat().st_mtime > ttl:
+            return None
+        return _json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a unique temporary file and ``os.replace``."""
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _get_crossref_page(params: dict, http_cache_dir: Optional[Path] = None) -> dict:
+    """GET one page of Crossref results and return the decoded payload.
+
+    With ``http_cache_dir`` the response body and its ``ETag``/``Last-Modified``
+    validators are stored per request. Later identical requests are sent as
+    conditional GETs; a ``304 Not Modified`` is answered from the stored body.
+    """
+
+    if http_cache_dir is None:
+        response = _get_session().get(CROSSREF_API, params=params, timeout=30)
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    key = hashlib.blake2b(
+        json.dumps(sorted(params.items())).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    meta_path = http_cache_dir / f"{key}.meta"
+    body_path = http_cache_dir / f"{key}.body"
+
+    headers = {}
+    try:
+        meta = _json_loads(meta_path.read_bytes())
+    except (OSError, ValueError):
+        meta = {}
+    if body_path.exists():
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = _get_session().get(CROSSREF_API, params=params, headers=headers, timeout=30)
+    if response.status_code == 304:
+        return _json_loads(body_path.read_bytes())
+    response.raise_for_status()
+
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    if validators["etag"] or validators["last_modified"]:
+        http_cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(body_path, response.content)
+        _write_atomic(meta_path, _json_dumps(validators))
+    return _json_loads(response.content)
+
+
+def _request_crossref(
+    query: str,
+    rows: int,
+    from_year: Optional[int],
+    issn_filter: Optional[str],
+    full_text_only: bool = False,
+    http_cache_dir: Optional[Path] = None,
+) -> List[dict]:
+    """Query the Crossref works endpoint and return up to ``rows`` raw items.
+
+    Requests larger than one Crossref page are fetched concurrently by
+    ``offset`` once the first page reports ``total-results``; beyond
+    Crossref's offset limit they are deep-paged sequentially with ``cursor``.
+    """
 
     if requests is None:
         raise RuntimeError(
@@ -54,142 +258,303 @@ def fetch_articles(
             "Install it or provide a cached dataset via --cache."
         )
 
-    headers = {"User-Agent": USER_AGENT}
     params = {
         "query": query,
         "sort": "is-referenced-by-count",
         "order": "desc",
-        "rows": rows,
+        "rows": min(rows, CROSSREF_MAX_ROWS),
+        "select": CROSSREF_SELECT,
     }
     filters: List[str] = []
     if from_year is not None:
         filters.append(f"from-pub-date:{from_year}-01-01")
     if issn_filter:
         filters.append(f"issn:{issn_filter}")
+    if full_text_only:
+        filters.append("has-full-text:true")
     if filters:
         params["filter"] = ",".join(filters)
 
-    response = requests.get(CROSSREF_API, headers=headers, params=params, timeout=30)
-    response.raise_for_status()
-    items = response.json().get("message", {}).get("items", [])
-
-    articles: List[Article] = []
-    for item in items:
-        title = item.get("title", ["Unnamed Article"])[0]
-        doi = item.get("DOI", "")
-        year = None
-        if item.get("issued", {}).get("date-parts"):
-            year = item["issued"]["date-parts"][0][0]
-        journal = item.get("container-title", ["Unknown Journal"])[0]
-        citation_count = item.get("is-referenced-by-count", 0)
-        authors = ", ".join(
-            filter(
-                None,
-                [
-                    " ".join(
-                        filter(
-                            None,
-                            [
-                                person.get("given", ""),
-                                person.get("family", ""),
-                            ],
-                        )
-                    ).strip()
-                    for person in item.get("author", [])
-                ],
-            )
-        )
+    if rows > CROSSREF_MAX_OFFSET:
+        return _request_crossref_cursor(params, rows, http_cache_dir)
+
+    message = _get_crossref_page(params, http_cache_dir).get("message", {})
+    items: List[dict] = list(message.get("items", []))
+    total = min(rows, message.get("total-results", len(items)))
+    if len(items) < CROSSREF_MAX_ROWS or total <= len(items):
+        return items[:rows]
+
+    offsets = range(CROSSREF_MAX_ROWS, total, CROSSREF_MAX_ROWS)
+    pages = {}
+    with ThreadPoolExecutor(max_workers=CROSSREF_PAGE_WORKERS) as executor:
+        futures = {}
+        for index, offset in enumerate(offsets):
+            if index:
+                time.sleep(CROSSREF_SUBMIT_INTERVAL)
+            page_params = dict(params, offset=offset)
+            futures[executor.submit(_get_crossref_page, page_params, http_cache_dir)] = offset
+        for future in as_completed(futures):
+            pages[futures[future]] = future.result().get("message", {}).get("items", [])
+    for offset in offsets:
+        items.extend(pages[offset])
+    return items[:rows]
+
+
+def _request_crossref_cursor(
+    params: dict, rows: int, http_cache_dir: Optional[Path] = None
+) -> List[dict]:
+    """Deep-page a Crossref query with ``cursor`` until ``rows`` items are read.
+
+    Only the first page (``cursor=*``) goes through ``http_cache_dir``; the
+    ``next-cursor`` tokens differ on every run, so later pages are never reused.
+    """
+
+    params = dict(params, cursor="*")
+    items: List[dict] = []
+    while True:
+        page_cache_dir = http_cache_dir if params["cursor"] == "*" else None
+        message = _get_crossref_page(params, page_cache_dir).get("message", {})
+        page = message.get("items", [])
+        items.extend(page)
+        next_cursor = message.get("next-cursor")
+        if not page or not next_cursor or len(items) >= rows:
+            break
+        params["cursor"] = next_cursor
+    return items[:rows]
 
-        articles.append(
-            Article(
-                title=title,
-                doi=doi,
-                year=year,
-                journal=journal,
-                citation_count=citation_count,
-                authors=authors,
-            )
-        )
 
+def fetch_articles(
+    query: str,
+    rows: int = 20,
+    from_year: Optional[int] = None,
+    issn_filter: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+    cache_ttl: float = DEFAULT_QUERY_CACHE_TTL,
+    full_text_only: bool = False,
+    http_cache_dir: Optional[Path] = None,
+) -> List[Article]:
+    """Retrieve highly cited articles from Crossref.
+
+    When ``cache_dir`` is given, responses are stored there keyed by the request
+    parameters and reused without network access for ``cache_ttl`` seconds.
+    ``full_text_only`` restricts results to works that advertise full-text links.
+    ``http_cache_dir`` enables ETag revalidation of Crossref responses.
+
+    With ``cache_dir`` the parsed articles are also kept in memory for the most
+    recent calls and returned directly while the underlying Crossref response
+    is younger than ``cache_ttl``. Without ``cache_dir`` every call queries
+    Crossref.
+    """
+
+    memo_key = None
+    if cache_dir is not None:
+        memo_key = (
+            query, rows, from_year, issn_filter, full_text_only, cache_dir, http_cache_dir
+        )
+        memo = _ARTICLE_MEMO.get(memo_key)
+        if memo is not None and time.time() - memo[0] <= cache_ttl:
+            _ARTICLE_MEMO.move_to_end(memo_key)
+            return list(memo[1])
+
+    cache_file: Optional[Path] = None
+    items: Optional[List[dict]] = None
+    fetched_at = time.time()
+    if cache_dir is not None:
+        key = _query_cache_key(query, rows, from_year, issn_filter, full_text_only)
+        cache_file = cache_dir / f"{key}.json"
+        items = _read_query_cache(cache_file, cache_ttl)
+        if items is not None:
+            fetched_at = cache_file.stat().st_mtime
+    if items is None:
+        items = _request_crossref(
+            query, rows, from_year, issn_filter, full_text_only, http_cache_dir
+        )
+        if cache_file is not None:
+            # An unwritable cache location only disables caching for this run.
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                _write_atomic(cache_file, _json_dumps(items))
+            except OSError:
+                pass
+
+    articles = [_article_from_item(item) for item in items]
+    if memo_key is not None:
+        _ARTICLE_MEMO[memo_key] = (fetched_at, tuple(articles))
+        _ARTICLE_MEMO.move_to_end(memo_key)
+        while len(_ARTICLE_MEMO) > ARTICLE_MEMO_SIZE:
+            _ARTICLE_MEMO.popitem(last=False)
     return articles
 
 
-def load_cached_articles(cache_path: Path) -> List[Article]:
-    """Load article metadata from a JSON cache file."""
+def _article_from_item(item: dict) -> Article:
+    """Build an Article from a raw Crossref work item."""
+
+    g = item.get
+    issued = g("issued")
+    names: List[str] = []
+    for person in g("author") or ():
+        given = person.get("given") or ""
+        family = person.get("family") or ""
+        if given and family:
+            names.append(given + " " + family)
+        elif family:
+            names.append(family)
+        elif given:
+            names.append(given)
+    return Article(
+        title=(g("title") or ["Unnamed Article"])[0],
+        doi=g("DOI", ""),
+        year=issued["date-parts"][0][0] if issued and issued.get("date-parts") else None,
+        journal=(g("container-title") or ["Unknown Journal"])[0],
+        citation_count=g("is-referenced-by-count", 0),
+        authors=", ".join(names),
+    )
+
+
+def _article_from_cache(item: dict) -> Article:
+    """Build an Article from one entry of a --cache JSON file."""
+
+    return Article(
+        title=item.get("title", "Unnamed Article"),
+        doi=item.get("doi", ""),
+        year=item.get("year"),
+        journal=item.get("journal", "Unknown Journal"),
+        citation_count=item.get("citation_count", 0),
+        authors=item.get("authors", ""),
+    )
+
+
+def _rank_articles(articles: Iterable[Article], rows: Optional[int]) -> List[Article]:
+    """Order articles by citation count, keeping only the top ``rows`` if given."""
+
+    if rows is not None:
+        return heapq.nlargest(rows, articles, key=_BY_CITATIONS)
+    ranked = list(articles)
+    ranked.sort(key=_BY_CITATIONS, reverse=True)
+    return ranked
+
+
+def load_cached_articles(cache_path: Path, rows: Optional[int] = None) -> List[Article]:
+    """Load article metadata from a JSON cache file, most cited first.
+
+    When ``rows`` is given only the top ``rows`` articles are selected, which
+    avoids sorting the whole cache. Caches larger than
+    ``STREAMING_CACHE_THRESHOLD`` bytes are parsed incrementally with ijson,
+    when installed, so the raw JSON tree is never held in memory at once.
+    """
 
     if not cache_path.exists():
         raise FileNotFoundError(f"Cache file not found: {cache_path}")
 
-    raw = json.loads(cache_path.read_text(encoding="utf-8"))
-
-    articles: List[Article] = []
-    for item in raw:
-        articles.append(
-            Article(
-                title=item.get("title", "Unnamed Article"),
-                doi=item.get("doi", ""),
-                year=item.get("year"),
-                journal=item.get("journal", "Unknown Journal"),
-                citation_count=item.get("citation_count", 0),
-                authors=item.get("authors", ""),
-            )
-        )
+    if ijson is not None and cache_path.stat().st_size > STREAMING_CACHE_THRESHOLD:
+        with cache_path.open("rb") as handle:
+            items = ijson.items(handle, "item", use_float=True)
+            return _rank_articles((_article_from_cache(item) for item in items), rows)
 
-    return sorted(articles, key=lambda item: item.citation_count, reverse=True)
+    raw = _json_loads(cache_path.read_bytes())
+    return _rank_articles((_article_from_cache(item) for item in raw), rows)
 
 
-def to_markdown(articles: Iterable[Article]) -> str:
-    """Render a Markdown table from article metadata."""
+def dump_cached_articles(articles: Iterable[Article], cache_path: Path) -> None:
+    """Write article metadata to a JSON cache readable by ``load_cached_articles``."""
+
+    if orjson is not None:
+        content = orjson.dumps(list(articles), option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(
+            [dataclasses.asdict(article) for article in articles],
+            ensure_ascii=False,
+            indent=2,
+        ).encode("utf-8")
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(content)
+
+
+def to_markdown_stream(articles: Iterable[Article], fp: TextIO) -> None:
+    """Write a Markdown table of article metadata to ``fp`` row by row."""
 
-    header = "| 标题 | 期刊 | 年份 | 引用次数 | DOI | 作者 |\n"
-    separator = "| --- | --- | --- | --- | --- | --- |\n"
-    rows = []
+    fp.write("| 标题 | 期刊 | 年份 | 引用次数 | DOI | 作者 |\n")
+    fp.write("| --- | --- | --- | --- | --- | --- |\n")
+    newline = ""
     for article in articles:
-        doi_link = f"https://doi.org/{article.doi}" if article.doi else ""
-        rows.append(
-            "| {title} | {journal} | {year} | {citations} | {doi} | {authors} |".format(
-                title=article.title.replace("|", "／"),
-                journal=article.journal.replace("|", "／"),
-                year=article.year or "-",
-                citations=article.citation_count,
-                doi=f"[{article.doi}]({doi_link})" if article.doi else "-",
-                authors=(article.authors or "-").replace("|", "／"),
-            )
+        doi = f"[{article.doi}]({DOI_URL_PREFIX}{article.doi})" if article.doi else "-"
+        fp.write(
+            f"{newline}| {article.title.translate(_MD_ESCAPE)} "
+            f"| {article.journal.translate(_MD_ESCAPE)} "
+            f"| {article.year or '-'} "
+            f"| {article.citation_count} "
+            f"| {doi} "
+            f"| {(article.authors or '-').translate(_MD_ESCAPE)} |"
+        )
+        newline = "\n"
+
+
+def to_csv_stream(articles: Iterable[Article], fp: TextIO) -> None:
+    """Write CSV rows of article metadata to ``fp``."""
+
+    writer = csv.writer(fp, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+    writer.writerow(("title", "journal", "year", "citation_count", "doi", "authors"))
+    writer.writerows(
+        (
+            article.title,
+            article.journal,
+            article.year,
+            article.citation_count,
+            article.doi,
+            article.authors,
         )
-    return header + separator + "\n".join(rows)
+        for article in articles
+    )
+
+
+def to_markdown(articles: Iterable[Article]) -> str:
+    """Render a Markdown table from article metadata."""
+
+    buffer = io.StringIO()
+    to_markdown_stream(articles, buffer)
+    return buffer.getvalue()
 
 
 def to_csv(articles: Iterable[Article]) -> str:
     """Render a CSV string from article metadata."""
 
-    lines = ["title,journal,year,citation_count,doi,authors"]
-    for article in articles:
-        line = ",".join(
-            json.dumps(value, ensure_ascii=False)
-            for value in (
-                article.title,
-                article.journal,
-                article.year,
-                article.citation_count,
-                article.doi,
-                article.authors,
-            )
-        )
-        lines.append(line)
-    return "\n".join(lines)
+    buffer = io.StringIO()
+    to_csv_stream(articles, buffer)
+    return buffer.getvalue()
 
 
-def write_output(content: str, output: Optional[Path]) -> None:
-    """Write scraper output to a path or stdout."""
+@contextlib.contextmanager
+def open_output(output: Optional[Path]) -> Iterator[TextIO]:
+    """Yield the text stream scraper output is rendered into.
+
+    Files are written as UTF-8 through a 64 KiB buffer without newline
+    translation; stdout keeps its configured encoding and is flushed on exit.
+    """
 
     if output:
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(content, encoding="utf-8")
-    else:
-        sys.stdout.write(content)
+        with output.open(
+            "w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_SIZE
+        ) as fp:
+            yield fp
+        return
 
+    yield sys.stdout
+    sys.stdout.flush()
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+
+def write_output(content: str, output: Optional[Path]) -> None:
+    """Write scraper output to a path or stdout.
+
+    Not used by ``main``, which streams through ``open_output``; kept only as
+    public API for callers that already hold the rendered text.
+    """
+
+    with open_output(output) as fp:
+        fp.write(content)
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Fetch highly cited SCI literature for serum TDP-43 studies.",
     )
@@ -203,13 +568,18 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--from-year",
         type=int,
-        default=datetime.now().year - 10,
+        default=None,
         help="Lower bound year for publication date filter (default: 10 years ago).",
     )
     parser.add_argument(
         "--issn",
         help="Optional ISSN filter to restrict results to a specific journal.",
     )
+    parser.add_argument(
+        "--full-text-only",
+        action="store_true",
+        help="Only return works that advertise full-text links (Crossref has-full-text filter).",
+    )
     parser.add_argument(
         "--format",
         choices=("markdown", "csv"),
@@ -230,20 +600,63 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
             "for provenance in logs."
         ),
     )
-    return parser.parse_args(args)
+    parser.add_argument(
+        "--save-cache",
+        type=Path,
+        help="Save the retrieved articles as a JSON cache usable with --cache.",
+    )
+    parser.add_argument(
+        "--query-cache-ttl",
+        type=float,
+        default=DEFAULT_QUERY_CACHE_TTL,
+        help=(
+            "Seconds to reuse a stored Crossref response for an identical query "
+            f"(default: {DEFAULT_QUERY_CACHE_TTL}). Responses are kept in {QUERY_CACHE_DIR}."
+        ),
+    )
+    parser.add_argument(
+        "--no-query-cache",
+        action="store_true",
+        help="Always query Crossref and do not store the response.",
+    )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help=(
+            f"Keep Crossref responses with their ETag in {HTTP_CACHE_DIR} and "
+            "revalidate them with conditional requests on later runs."
+        ),
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    options = _PARSER.parse_args(args)
+    if options.from_year is None:
+        # Resolved per call rather than at import so long-lived processes and
+        # scheduled jobs pick up the year boundary.
+        options.from_year = datetime.now().year - 10
+    return options
 
 
 def main(cli_args: Optional[List[str]] = None) -> None:
     options = parse_args(cli_args)
     try:
         if options.cache:
-            articles = load_cached_articles(options.cache)
+            articles = load_cached_articles(options.cache, rows=options.rows)
         else:
             articles = fetch_articles(
                 query=options.query,
                 rows=options.rows,
                 from_year=options.from_year,
                 issn_filter=options.issn,
+                cache_dir=None if options.no_query_cache else QUERY_CACHE_DIR,
+                cache_ttl=options.query_cache_ttl,
+                full_text_only=options.full_text_only,
+                http_cache_dir=HTTP_CACHE_DIR if options.http_cache else None,
             )
     except RuntimeError as exc:
         raise SystemExit(str(exc)) from exc
@@ -253,14 +666,15 @@ def main(cli_args: Optional[List[str]] = None) -> None:
     if not articles:
         raise SystemExit("No articles found for the provided query.")
 
-    articles = articles[: options.rows]
+    if options.save_cache:
+        dump_cached_articles(articles, options.save_cache)
 
-    if options.format == "markdown":
-        content = to_markdown(articles)
-    else:
-        content = to_csv(articles)
+    if len(articles) > options.rows:
+        articles = articles[: options.rows]
 
-    write_output(content, options.output)
+    render = to_markdown_stream if options.format == "markdown" else to_csv_stream
+    with open_output(options.output) as fp:
+        render(articles, fp)
 
 
 if __name__ == "__main__":